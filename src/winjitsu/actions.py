@@ -9,30 +9,38 @@ DIRECTION_ACTIONS = {"N", "S", "E", "W", "NE", "NW", "SE", "SW", "C"}
 
 
 # --- Grid snapping ---
+# Target (width, height, x, y) per direction, as functions of screen width/
+# height, half-width/height and screen origin. Built once at import; only the
+# picked direction's tuple is evaluated per call. "C" is special-cased in
+# direction() because it depends on the window's own size.
+_DIRECTION_TARGETS = {
+    "N":  lambda sw, sh, hw, hh, ox, oy: (sw, hh, ox,      oy),
+    "S":  lambda sw, sh, hw, hh, ox, oy: (sw, hh, ox,      oy + hh),
+    "E":  lambda sw, sh, hw, hh, ox, oy: (hw, sh, ox + hw, oy),
+    "W":  lambda sw, sh, hw, hh, ox, oy: (hw, sh, ox,      oy),
+    "NE": lambda sw, sh, hw, hh, ox, oy: (hw, hh, ox + hw, oy),
+    "NW": lambda sw, sh, hw, hh, ox, oy: (hw, hh, ox,      oy),
+    "SE": lambda sw, sh, hw, hh, ox, oy: (hw, hh, ox + hw, oy + hh),
+    "SW": lambda sw, sh, hw, hh, ox, oy: (hw, hh, ox,      oy + hh),
+}
+
+
 def direction(direction_code):
     window = get_window_position()
     screen_width, screen_height, screen_origin_x, screen_origin_y = get_screen_for_window(window)
-    half_width = screen_width / 2
-    half_height = screen_height / 2
-
-    centered_x = screen_origin_x + (screen_width - window["WIDTH"]) / 2
-    centered_y = screen_origin_y + (screen_height - window["HEIGHT"]) / 2
-
-    targets_by_direction = {
-        "N":  {"width": screen_width, "height": half_height,  "x": screen_origin_x,              "y": screen_origin_y},
-        "S":  {"width": screen_width, "height": half_height,  "x": screen_origin_x,              "y": screen_origin_y + half_height},
-        "E":  {"width": half_width,   "height": screen_height,"x": screen_origin_x + half_width, "y": screen_origin_y},
-        "W":  {"width": half_width,   "height": screen_height,"x": screen_origin_x,              "y": screen_origin_y},
-        "NE": {"width": half_width,   "height": half_height,  "x": screen_origin_x + half_width, "y": screen_origin_y},
-        "NW": {"width": half_width,   "height": half_height,  "x": screen_origin_x,              "y": screen_origin_y},
-        "SE": {"width": half_width,   "height": half_height,  "x": screen_origin_x + half_width, "y": screen_origin_y + half_height},
-        "SW": {"width": half_width,   "height": half_height,  "x": screen_origin_x,              "y": screen_origin_y + half_height},
-        "C":  {"width": window["WIDTH"], "height": window["HEIGHT"], "x": centered_x, "y": centered_y},
-    }
-
-    target = targets_by_direction[direction_code]
-    target_width, target_height = target["width"], target["height"]
-    target_x, target_y = target["x"], target["y"]
+    # Integer division keeps every target an int — xdotool and X11 only take
+    # integer geometry, so nothing downstream has to re-round.
+    half_width = screen_width // 2
+    half_height = screen_height // 2
+
+    if direction_code == "C":
+        target_width, target_height = window["WIDTH"], window["HEIGHT"]
+        target_x = screen_origin_x + (screen_width - target_width) // 2
+        target_y = screen_origin_y + (screen_height - target_height) // 2
+    else:
+        target_width, target_height, target_x, target_y = _DIRECTION_TARGETS[direction_code](
+            screen_width, screen_height, half_width, half_height, screen_origin_x, screen_origin_y
+        )
 
     _update_state(window, target_x, target_y, target_width, target_height)
     move_window(
@@ -69,7 +77,8 @@ def fullscreen(window=None, screen_width=None, screen_height=None, screen_origin
 def restore(window=None):
     window = window or get_window_position()
     window_id = window["WINDOW"]
-    saved_state = load_state(window_id, get_wm_class(window_id))
+    wm_class = window["WM_CLASS"] if "WM_CLASS" in window else get_wm_class(window_id)
+    saved_state = load_state(window_id, wm_class)
     if saved_state is None:
         return
 
@@ -108,7 +117,7 @@ def toggle_display():
     if not primary_screen or not other_screens:
         return
 
-    all_screens = [primary_screen] + other_screens
+    all_screens = [primary_screen, *other_screens]
     window_center_x = window["X"] + window["WIDTH"] / 2
     window_center_y = window["Y"] + window["HEIGHT"] / 2
 
@@ -134,7 +143,7 @@ def toggle_display():
     target_y = target_screen["y"] + (window["Y"] - current_screen["y"])
 
     window_id = window["WINDOW"]
-    wm_class = get_wm_class(window_id)
+    wm_class = window["WM_CLASS"] if "WM_CLASS" in window else get_wm_class(window_id)
     target_home_state = {
         "WINDOW": window_id,
         "X": target_x, "Y": target_y,
@@ -1,21 +1,60 @@
 import json
-import shutil
+import os
 from pathlib import Path
 
 from .window import get_wm_class
 
 
-CACHE_DIR = Path.home() / ".cache" / "winjitsu"
+CACHE_DIR  = Path.home() / ".cache" / "winjitsu"
+STATE_PATH = CACHE_DIR / "state.json"
+
+# In-memory copy of state.json, keyed by window id (as str — JSON object
+# keys). Loaded at most once per process: the CLI reads it once per
+# invocation, the daemon keeps it warm across actions.
+_state_cache = None
+
+
+def _load_index():
+    global _state_cache
+    if _state_cache is None:
+        try:
+            with open(STATE_PATH) as f:
+                _state_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
+            _state_cache = {}
+        _migrate_legacy_files()
+    return _state_cache
+
+
+def _migrate_legacy_files():
+    # One-time migration from the old one-file-per-window layout.
+    migrated = False
+    for legacy_path in CACHE_DIR.glob("*.json"):
+        if legacy_path.name == STATE_PATH.name:
+            continue
+        try:
+            with open(legacy_path) as f:
+                _state_cache.setdefault(legacy_path.stem, json.load(f))
+            migrated = True
+        except (json.JSONDecodeError, ValueError):
+            pass
+        legacy_path.unlink(missing_ok=True)
+    if migrated:
+        _write_index()
+
+
+def _write_index():
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a crash mid-write never leaves a truncated index.
+    temp_path = STATE_PATH.with_name("state.json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(_state_cache, f)
+    os.replace(temp_path, STATE_PATH)
 
 
 def load_state(window_id, wm_class):
-    cache_file_path = CACHE_DIR / f"{window_id}.json"
-    if not cache_file_path.exists():
-        return None
-    try:
-        with open(cache_file_path) as f:
-            cached_state = json.load(f)
-    except (json.JSONDecodeError, ValueError):
+    cached_state = _load_index().get(str(window_id))
+    if cached_state is None:
         return None
     # X11 window IDs are recycled across sessions — reject cache if the app changed
     if cached_state.get("WM_CLASS") != wm_class:
@@ -24,17 +63,22 @@ def load_state(window_id, wm_class):
 
 
 def save_state(window_id, home_state, target_x, target_y, target_width, target_height, wm_class):
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_DIR / f"{window_id}.json", "w") as f:
-        json.dump({
-            "WINDOW": home_state["WINDOW"],
-            "X": home_state["X"], "Y": home_state["Y"],
-            "WIDTH": home_state["WIDTH"], "HEIGHT": home_state["HEIGHT"],
-            "SCREEN": home_state.get("SCREEN", 0),
-            "WM_CLASS": wm_class,
-            "_last_X": target_x, "_last_Y": target_y,
-            "_last_W": target_width, "_last_H": target_height,
-        }, f)
+    state_index = _load_index()
+    new_entry = {
+        "WINDOW": home_state["WINDOW"],
+        "X": home_state["X"], "Y": home_state["Y"],
+        "WIDTH": home_state["WIDTH"], "HEIGHT": home_state["HEIGHT"],
+        "SCREEN": home_state.get("SCREEN", 0),
+        "WM_CLASS": wm_class,
+        "_last_X": target_x, "_last_Y": target_y,
+        "_last_W": target_width, "_last_H": target_height,
+    }
+    # Bouncing a window between the same two geometries (e.g. repeated TF)
+    # produces identical entries — skip the disk write when nothing changed.
+    if state_index.get(str(window_id)) == new_entry:
+        return
+    state_index[str(window_id)] = new_entry
+    _write_index()
 
 
 def _resolve_home(window, cached_state):
@@ -57,12 +101,22 @@ def _resolve_home(window, cached_state):
 
 
 def _update_state(window, target_x, target_y, target_width, target_height):
-    wm_class = get_wm_class(window["WINDOW"])
+    # get_window_position already fetched WM_CLASS in the same xdotool call;
+    # only fork again for callers that pass a bare geometry dict.
+    wm_class = window["WM_CLASS"] if "WM_CLASS" in window else get_wm_class(window["WINDOW"])
     cached_state = load_state(window["WINDOW"], wm_class)
     home_state = _resolve_home(window, cached_state)
     save_state(window["WINDOW"], home_state, target_x, target_y, target_width, target_height, wm_class)
 
 
 def clear_cache():
-    if CACHE_DIR.exists():
-        shutil.rmtree(CACHE_DIR)
+    global _state_cache
+    _state_cache = None
+    # The cache dir only ever holds state.json (plus, at worst, a stray tmp
+    # file) — unlink + rmdir does the job without importing shutil for rmtree.
+    try:
+        for cache_file in CACHE_DIR.glob("*"):
+            cache_file.unlink()
+        CACHE_DIR.rmdir()
+    except OSError:
+        pass
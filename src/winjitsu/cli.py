@@ -1,6 +1,5 @@
 import os
 import sys
-import argparse
 import signal
 import time
 from pathlib import Path
@@ -37,7 +36,25 @@ config file: ~/.config/winjitsu/config.ini  (XDG_CONFIG_HOME honoured)
 """
 
 
+def _run_action(action):
+    try:
+        if not send_command(action):
+            dispatch(action)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
+    # Fast path: a bare action — the hotkey case, i.e. almost every
+    # invocation — skips argparse entirely. Importing argparse and building
+    # the parser costs double-digit milliseconds, a big slice of a run whose
+    # total budget is ~50 ms.
+    if len(sys.argv) == 2 and sys.argv[1] in VALID_ACTIONS:
+        _run_action(sys.argv[1])
+        return
+
+    import argparse
     import winjitsu.config as _config_module
 
     # Pre-parse --read-config before the main parser so globals are updated
@@ -60,7 +77,8 @@ def main():
     parser.add_argument("--write-config",   action="store_true",    help="create config file with defaults and exit")
     parser.add_argument("--read-config",    metavar="PATH",         help="use a custom config file path")
     parser.add_argument("--see-config",     action="store_true",    help="print current config values and exit")
-    parser.add_argument("--steps",          type=int, metavar="N",  help="animation steps, overrides config (default: 25)")
+    parser.add_argument("--steps",          type=int, metavar="N",  help="animation steps, 0 = instant snap, overrides config (default: 25)")
+    parser.add_argument("--frame-ms",       type=int, metavar="MS", help="minimum time per animation frame, overrides config (default: 8)")
     parser.add_argument("--padding",        type=int, metavar="PX", help="fullscreen padding in pixels, overrides config (default: 0)")
     parser.add_argument("--delay-ms",       type=int, metavar="MS", help="action delay in milliseconds, overrides config (default: 250)")
     parsed_args = parser.parse_args()
@@ -69,6 +87,7 @@ def main():
 
     # CLI flags override config file and defaults
     if parsed_args.steps    is not None: config.steps    = parsed_args.steps
+    if parsed_args.frame_ms is not None: config.frame_ms = parsed_args.frame_ms
     if parsed_args.padding  is not None: config.padding  = parsed_args.padding
     if parsed_args.delay_ms is not None: config.delay_ms = parsed_args.delay_ms
 
@@ -80,6 +99,7 @@ def main():
         status = "exists" if config.path.exists() else "not found — using defaults"
         print(f"config file : {config.path}  ({status})")
         print(f"steps       : {config.steps}")
+        print(f"frame_ms    : {config.frame_ms}")
         print(f"padding     : {config.padding}")
         print(f"delay_ms    : {config.delay_ms}")
         return
@@ -119,9 +139,4 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    try:
-        if not send_command(parsed_args.action):
-            dispatch(parsed_args.action)
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    _run_action(parsed_args.action)
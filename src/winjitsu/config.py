@@ -11,6 +11,7 @@ _CONFIG_PATH = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
 @dataclass
 class _Config:
     steps: int
+    frame_ms: int
     padding: int
     delay_ms: int
     path: Path
@@ -19,7 +20,7 @@ class _Config:
 def _load_config(path=None):
     ini_parser = configparser.ConfigParser()
     ini_parser.read_dict({
-        "animation": {"steps": "25"},
+        "animation": {"steps": "25", "frame_ms": "8"},
         "display":   {"padding": "0"},
         "daemon":    {"delay_ms": "250"},
     })
@@ -27,6 +28,7 @@ def _load_config(path=None):
     ini_parser.read(config_path)
     return _Config(
         steps=ini_parser.getint("animation", "steps"),
+        frame_ms=ini_parser.getint("animation", "frame_ms"),
         padding=ini_parser.getint("display", "padding"),
         delay_ms=ini_parser.getint("daemon", "delay_ms"),
         path=config_path,
@@ -45,9 +47,14 @@ def _write_config(config_path, active_config):
 
 [animation]
 # Steps in the window movement animation.
-# Higher = smoother but slower. Default: 25
+# Higher = smoother but slower. 0 = no animation (instant snap). Default: 25
 steps = {active_config.steps}
 
+# Minimum time per animation frame, in milliseconds. The animation paces
+# itself to this budget and drops frames when it can't keep up.
+# Default: 8 (~120 Hz)
+frame_ms = {active_config.frame_ms}
+
 [display]
 # Gap in pixels around the window when using F (fullscreen).
 # 0 = true fullscreen, 5 = small gap on all sides. Default: 0
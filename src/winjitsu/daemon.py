@@ -8,12 +8,19 @@ import threading
 from .config import _CFG
 from .actions import dispatch, VALID_ACTIONS
 from .cache import clear_cache
+from .screen import get_screens
 
 
-_XDG_DATA_HOME = os.environ.get("XDG_DATA_HOME", str(os.path.join(os.path.expanduser("~"), ".local", "share")))
+# Socket and PID file belong in XDG_RUNTIME_DIR: it's a per-session tmpfs
+# with 0700 permissions, cleaned up on logout — exactly right for a daemon
+# rendezvous point. Fall back to the data dir when it's unset (non-systemd
+# setups).
+_XDG_RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get(
+    "XDG_DATA_HOME", str(os.path.join(os.path.expanduser("~"), ".local", "share"))
+)
 
 from pathlib import Path
-_RUNTIME_DIR = Path(_XDG_DATA_HOME) / "winjitsu"
+_RUNTIME_DIR = Path(_XDG_RUNTIME_DIR) / "winjitsu"
 SOCKET_PATH  = _RUNTIME_DIR / "winjitsu.sock"
 PID_PATH     = _RUNTIME_DIR / "winjitsu.pid"
 
@@ -37,6 +44,8 @@ def _run_action(action):
     global _pending_timer
     with _pending_lock:
         _pending_timer = None
+    # Re-query RandR per action — the daemon outlives monitor hotplug events.
+    get_screens.cache_clear()
     dispatch(action)
 
 
@@ -1,6 +1,8 @@
+import functools
 import threading
 
 from Xlib import display as Xdisplay
+from Xlib import error as Xerror
 from Xlib.ext import randr
 
 
@@ -17,18 +19,41 @@ def _get_display() -> Xdisplay.Display:
     return _display
 
 
+# Cached so one action queries RandR exactly once, no matter how many callers
+# ask (e.g. TF goes through get_screen_for_window and fullscreen). The daemon
+# clears the cache before each action so monitor hotplug is still picked up.
+@functools.lru_cache(maxsize=1)
 def get_screens():
     display = _get_display()
     if not display.has_extension('RANDR'):
         raise RuntimeError("RandR extension not available.")
-    root             = display.screen().root
-    resources        = root.xrandr_get_screen_resources()
-    config_timestamp = resources.config_timestamp  # config_timestamp, NOT timestamp — timestamp causes BadMatch on some drivers
-    primary_id       = root.xrandr_get_output_primary().output
+    root = display.screen().root
 
     primary = None
     others  = []
 
+    # RandR 1.5 GetMonitors reports every active monitor — geometry and
+    # primary flag included — in a single roundtrip, versus 2 + 2-per-output
+    # roundtrips for the resources/output/crtc walk below.
+    try:
+        monitors = root.xrandr_get_monitors(is_active=True).monitors
+    except (AttributeError, Xerror.XError):
+        monitors = None
+    if monitors:
+        for monitor in monitors:
+            screen_geometry = {"width": monitor.width_in_pixels, "height": monitor.height_in_pixels,
+                               "x": monitor.x, "y": monitor.y}
+            if monitor.primary:
+                primary = screen_geometry
+            else:
+                others.append(screen_geometry)
+        return primary, tuple(others)
+
+    # Fallback for servers without RandR 1.5: walk outputs and crtcs.
+    resources        = root.xrandr_get_screen_resources()
+    config_timestamp = resources.config_timestamp  # config_timestamp, NOT timestamp — timestamp causes BadMatch on some drivers
+    primary_id       = root.xrandr_get_output_primary().output
+
     for output_id in resources.outputs:
         output_info = display.xrandr_get_output_info(output_id, config_timestamp)
         if output_info.connection != randr.Connected or not output_info.crtc:
@@ -41,7 +66,7 @@ def get_screens():
         else:
             others.append(screen_geometry)
 
-    return primary, others
+    return primary, tuple(others)
 
 
 def get_screen_for_window(window):
@@ -50,7 +75,12 @@ def get_screen_for_window(window):
         default_screen = _get_display().screen()
         return default_screen.width_in_pixels, default_screen.height_in_pixels, 0, 0
 
-    all_screens     = [primary] + others
+    if not others:
+        # Single monitor — the common case. It necessarily hosts the window,
+        # so skip the center-containment search entirely.
+        return primary["width"], primary["height"], primary["x"], primary["y"]
+
+    all_screens     = [primary, *others]
     window_center_x = window["X"] + window["WIDTH"] / 2
     window_center_y = window["Y"] + window["HEIGHT"] / 2
 
@@ -1,29 +1,105 @@
 import subprocess
+import time
+
+from Xlib import X
+from Xlib import error as Xerror
+from Xlib.protocol import event as Xevent
 
 from .config import _CFG
 from .screen import _get_display
 
 
 def get_window_position():
+    # The Xlib path answers every query an action needs over the already-open
+    # display — no fork at all. Fall back to the xdotool chain for anything it
+    # can't resolve (no _NET_ACTIVE_WINDOW, window vanished mid-query, ...).
     try:
-        window_id       = subprocess.check_output(["xdotool", "getactivewindow"]).decode().strip()
-        geometry_output = subprocess.check_output(["xdotool", "getwindowgeometry", "--shell", window_id]).decode()
-        window_geometry = {}
-        for line in geometry_output.splitlines():
-            key, value = line.split("=", 1)
+        window_position = _window_position_xlib()
+    except (Xerror.XError, AttributeError, IndexError, TypeError):
+        window_position = None
+    return window_position or _window_position_xdotool()
+
+
+def _window_position_xlib():
+    display   = _get_display()
+    root      = display.screen().root
+    active    = root.get_full_property(display.intern_atom("_NET_ACTIVE_WINDOW"), X.AnyPropertyType)
+    window_id = int(active.value[0])
+    if not window_id:
+        return None  # no active window — let the xdotool path have a go
+    window    = display.create_resource_object("window", window_id)
+    geometry  = window.get_geometry()
+    # Window-relative (0, 0) translated to root coordinates = absolute position,
+    # same as xdotool's getwindowgeometry.
+    absolute  = root.translate_coords(window, 0, 0)
+    wm_class  = window.get_wm_class()
+    return {
+        "WINDOW": window_id,
+        "X": absolute.x, "Y": absolute.y,
+        "WIDTH": geometry.width, "HEIGHT": geometry.height,
+        "SCREEN": 0,
+        "WM_CLASS": wm_class[1] if wm_class else None,
+    }
+
+
+def _window_position_xdotool():
+    # xdotool chains commands in one invocation: getwindowgeometry and
+    # getwindowclassname both pick up the window pushed by getactivewindow,
+    # so one fork and one X11 connection serve every query an action needs.
+    # --shell output already includes the WINDOW= line.
+    try:
+        query_output = subprocess.check_output(
+            ["xdotool", "getactivewindow", "getwindowgeometry", "--shell", "getwindowclassname"],
+            text=True,
+        )
+    except subprocess.CalledProcessError as error:
+        # getwindowclassname is last in the chain and fails for windows with
+        # no WM_CLASS set; the geometry it already printed is still usable.
+        query_output = error.output or ""
+    window_geometry = {"WM_CLASS": None}
+    for line in query_output.splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
             window_geometry[key] = int(value)
-        return window_geometry
-    except subprocess.CalledProcessError:
+        else:
+            # The only bare line is getwindowclassname's output.
+            window_geometry["WM_CLASS"] = line
+    if "WINDOW" not in window_geometry:
         raise RuntimeError("Could not get window position. Is xdotool installed?")
+    return window_geometry
 
 
 def get_wm_class(window_id):
     try:
-        return subprocess.check_output(
-            ["xdotool", "getwindowclassname", str(window_id)]
-        ).decode().strip()
-    except subprocess.CalledProcessError:
+        wm_class = _get_display().create_resource_object("window", int(window_id)).get_wm_class()
+    except Xerror.XError:
         return None
+    return wm_class[1] if wm_class else None
+
+
+_MOVERESIZE_FLAGS = (
+    X.StaticGravity  # x/y name the client window's top-left corner
+    | (1 << 8)       # x present
+    | (1 << 9)       # y present
+    | (1 << 10)      # width present
+    | (1 << 11)      # height present
+    | (2 << 12)      # source: pager / window-management tool
+)
+
+
+def _ewmh_moveresize(window_id, x, y, width, height):
+    # One _NET_MOVERESIZE_WINDOW ClientMessage sets the final geometry in a
+    # single X request — no subprocess at all.
+    display = _get_display()
+    message = Xevent.ClientMessage(
+        window=display.create_resource_object("window", int(window_id)),
+        client_type=display.intern_atom("_NET_MOVERESIZE_WINDOW"),
+        data=(32, [_MOVERESIZE_FLAGS, x, y, width, height]),
+    )
+    display.screen().root.send_event(
+        message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask
+    )
+    display.flush()
 
 
 def move_window(target_width, target_height, window_id, current_w, current_h, current_x, current_y, target_x, target_y):
@@ -31,7 +107,8 @@ def move_window(target_width, target_height, window_id, current_w, current_h, cu
         # smoothstep: eases in and out, producing natural-feeling animation
         return t * t * (3.0 - 2.0 * t)
 
-    display_screen = _get_display().screen()
+    display        = _get_display()
+    display_screen = display.screen()
     display_width, display_height = display_screen.width_in_pixels, display_screen.height_in_pixels
     target_width  = min(target_width,  display_width)
     target_height = min(target_height, display_height)
@@ -39,15 +116,55 @@ def move_window(target_width, target_height, window_id, current_w, current_h, cu
     target_x = max(0, min(target_x, display_width  - target_width))
     target_y = max(0, min(target_y, display_height - target_height))
 
-    window_id_str = str(window_id)
-    for step in range(1, _CFG.steps + 1):
-        ease_factor    = _ease(step / _CFG.steps)
-        interp_width   = current_w + (target_width  - current_w) * ease_factor
-        interp_height  = current_h + (target_height - current_h) * ease_factor
-        interp_x       = current_x + (target_x - current_x) * ease_factor
-        interp_y       = current_y + (target_y - current_y) * ease_factor
-        subprocess.run([
-            "xdotool",
-            "windowsize", window_id_str, str(round(interp_width)), str(round(interp_height)),
-            "windowmove", window_id_str, str(round(interp_x)),     str(round(interp_y)),
-        ])
+    if (target_width, target_height, target_x, target_y) == (current_w, current_h, current_x, current_y):
+        # Already exactly at the target — a repeated hotkey press costs nothing.
+        return
+
+    steps = _CFG.steps
+    if steps <= 0:
+        # Animation disabled: snap straight to the target with one X request.
+        # (Previously steps=0 left the loop empty and the window never moved.)
+        _ewmh_moveresize(window_id, target_x, target_y, target_width, target_height)
+        return
+
+    width_delta  = target_width  - current_w
+    height_delta = target_height - current_h
+    x_delta      = target_x - current_x
+    y_delta      = target_y - current_y
+
+    # Precompute every frame as an integer (w, h, x, y) tuple up front; the
+    # easing floats are rounded exactly once and the emit loop below does no
+    # arithmetic. The final frame has ease(1.0) == 1.0 so it lands exactly on
+    # the target.
+    frames = [
+        (
+            round(current_w + width_delta  * ease_factor),
+            round(current_h + height_delta * ease_factor),
+            round(current_x + x_delta      * ease_factor),
+            round(current_y + y_delta      * ease_factor),
+        )
+        for ease_factor in (_ease(step / steps) for step in range(1, steps + 1))
+    ]
+
+    # One ConfigureWindow request moves and resizes in the same X message, on
+    # the already-open display — no windowsize/windowmove pair and no
+    # subprocess anywhere in the animation. The loop paces itself against a
+    # monotonic deadline of frame_ms per frame; when it falls behind it drops
+    # intermediate frames instead of flooding the X server (the last frame is
+    # never dropped — it is the target geometry).
+    window          = display.create_resource_object("window", int(window_id))
+    frame_budget_ns = _CFG.frame_ms * 1_000_000
+    last_frame      = len(frames) - 1
+    next_deadline   = time.monotonic_ns() + frame_budget_ns
+    for frame_index, (frame_width, frame_height, frame_x, frame_y) in enumerate(frames):
+        if frame_index < last_frame and time.monotonic_ns() > next_deadline:
+            next_deadline += frame_budget_ns
+            continue
+        window.configure(x=frame_x, y=frame_y, width=frame_width, height=frame_height)
+        display.flush()
+        if frame_index < last_frame:
+            sleep_seconds = (next_deadline - time.monotonic_ns()) / 1e9
+            if sleep_seconds > 0:
+                time.sleep(sleep_seconds)
+            next_deadline += frame_budget_ns
+    display.sync()